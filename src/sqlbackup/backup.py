@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import itertools
+import multiprocessing.util
+import shutil
+import tempfile
 import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import IO, Any
+from typing import IO, TypeVar
 
+from sqlbackup.compression import open_gzip
 from sqlbackup.config import DbConfig
 from sqlbackup.connection import DatabaseConnection
 from sqlbackup.constants import (
@@ -14,6 +21,11 @@ from sqlbackup.constants import (
     ERR_BACKUP_PATH_EXISTS,
     ERR_INCLUDE_EXCLUDE_MUTUAL,
     ERR_INCLUDE_MISSING_TABLES,
+    ERR_ZIP_WITH_GZ_PATH,
+    GZ_EXT,
+    OUTPUT_BUFFER_SIZE,
+    PARALLEL_MIN_TABLES,
+    SQL_DELIMITER,
     SQL_DROP_TABLE,
     SQL_FOOTER,
     SQL_HEADER,
@@ -21,26 +33,28 @@ from sqlbackup.constants import (
     ZIP_EXT,
 )
 from sqlbackup.exceptions import BackupError
+from sqlbackup.formatting import column_formatters, format_rows
 
+_T = TypeVar("_T")
 
-def _format_value(value: Any) -> str:
-    """Format a Python value as a SQL literal."""
-    if value is None:
-        return "NULL"
-    if isinstance(value, bool):
-        return "1" if value else "0"
-    if isinstance(value, int):
-        return str(value)
-    if isinstance(value, float):
-        return repr(value)
-    if isinstance(value, bytes):
-        return "X'" + value.hex() + "'"
-    s = str(value).replace("\\", "\\\\").replace("'", "\\'")
-    return f"'{s}'"
+
+def _prefetched(items: Iterable[_T]) -> Iterator[_T]:
+    """Yield from *items* while the next item is fetched on a worker thread.
+
+    pymysql releases the GIL while it waits on the socket, so reading the
+    next batch from the server overlaps with formatting the current one.
+    *items* must not yield None.
+    """
+    it = iter(items)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(next, it, None)
+        while (item := future.result()) is not None:
+            future = pool.submit(next, it, None)
+            yield item
 
 
 def _write_table_data(
-    f: IO[str],
+    f: IO[bytes],
     db: DatabaseConnection,
     table: str,
     batch_size: int = DEFAULT_BATCH_SIZE,
@@ -51,15 +65,96 @@ def _write_table_data(
         return
 
     col_list = ", ".join(f"`{c}`" for c in columns)
+    formatters = column_formatters(db.get_column_type_codes(table))
 
-    for batch in db.iter_rows(table, batch_size=batch_size):
-        f.write(f"INSERT INTO `{table}` ({col_list}) VALUES\n")
-        row_strings: list[str] = []
-        for row in batch:
-            values = ", ".join(_format_value(v) for v in row)
-            row_strings.append(f"({values})")
-        f.write(",\n".join(row_strings))
-        f.write(";\n\n")
+    insert_prefix = f"INSERT INTO `{table}` ({col_list}) VALUES\n".encode()
+
+    # Peek before starting the prefetch thread: an empty table ends here.
+    # No row count is asked for up front: COUNT(*) scans the whole table
+    # on InnoDB, and information_schema TABLE_ROWS is only an estimate.
+    batches = iter(db.iter_rows(table, batch_size=batch_size))
+    first = next(batches, None)
+    if first is None:
+        return
+
+    for batch in _prefetched(itertools.chain((first,), batches)):
+        row_strings = format_rows(batch, formatters)
+        # The joined rows are encoded once and handed to the buffered writer
+        # as they are; gluing the prefix on first would copy the batch again.
+        f.write(insert_prefix)
+        f.write(",\n".join(row_strings).encode())
+        f.write(SQL_DELIMITER)
+
+
+def _dump_table(
+    f: IO[bytes],
+    db: DatabaseConnection,
+    table: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """Write the DROP/CREATE statements and data for one table."""
+    ddl = db.get_create_table(table)
+    f.write(b"".join((SQL_DROP_TABLE % table.encode(), ddl.encode(), SQL_DELIMITER)))
+    _write_table_data(f, db, table, batch_size=batch_size)
+
+
+# The connection a pool worker process dumps all of its tables over.
+_worker_db: DatabaseConnection | None = None
+
+
+def _worker_connection(config: DbConfig) -> DatabaseConnection:
+    """Return this worker process's connection, opening it on first use.
+
+    Opened here rather than in a pool initializer so that a connection
+    error reaches the caller as itself, not as a BrokenProcessPool. Pool
+    workers skip atexit hooks, so a multiprocessing finalizer closes it.
+    """
+    global _worker_db
+    if _worker_db is None:
+        db = DatabaseConnection(config, snapshot=True)
+        _worker_db = db.__enter__()
+        multiprocessing.util.Finalize(None, db.__exit__, exitpriority=0)
+    return _worker_db
+
+
+def _dump_table_to_path(config: DbConfig, table: str, path: Path, batch_size: int) -> None:
+    """Dump one table to *path* over the worker's connection (pool worker)."""
+    with open(path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+        _dump_table(f, _worker_connection(config), table, batch_size=batch_size)
+
+
+def _dump_tables_parallel(
+    f: IO[bytes],
+    config: DbConfig,
+    tables: list[str],
+    batch_size: int,
+    jobs: int,
+    work_dir: Path,
+) -> None:
+    """Dump *tables* in worker processes and append them to *f* in table order.
+
+    Each table goes to its own part file under *work_dir*; parts are copied
+    into *f* as soon as they and every table before them are done.
+    """
+    with (
+        tempfile.TemporaryDirectory(dir=work_dir) as tmp,
+        ProcessPoolExecutor(max_workers=min(jobs, len(tables))) as pool,
+    ):
+        parts = [Path(tmp) / f"{i}.sql" for i in range(len(tables))]
+        futures = [
+            pool.submit(_dump_table_to_path, config, table, part, batch_size)
+            for table, part in zip(tables, parts, strict=True)
+        ]
+        try:
+            for future, part in zip(futures, parts, strict=True):
+                future.result()
+                with open(part, "rb") as src:
+                    shutil.copyfileobj(src, f, OUTPUT_BUFFER_SIZE)
+                part.unlink()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
 
 def resolve_incremental_path(base_path: Path) -> Path:
@@ -95,6 +190,13 @@ def _zip_sql_file(sql_path: Path) -> Path:
     return zip_path
 
 
+def _open_output(path: Path) -> IO[bytes]:
+    """Open the dump file for writing, gzip-compressed if *path* ends in ``.gz``."""
+    if path.suffix.lower() == GZ_EXT:
+        return open_gzip(path, "wb")
+    return open(path, "wb", buffering=OUTPUT_BUFFER_SIZE)
+
+
 def _filter_tables(
     tables: list[str],
     includes: list[str] | None,
@@ -123,9 +225,13 @@ def backup_database(
     zip: bool = False,
     includes: list[str] | None = None,
     excludes: list[str] | None = None,
+    jobs: int = 1,
 ) -> Path:
     """Dump a database to a .sql file (optionally compressed as .zip).
 
+    An *output_path* ending in ``.gz`` (e.g. ``db.sql.gz``) is gzip-compressed
+    while it is written.
+
     Args:
         config: Database connection configuration.
         output_path: Path for the output SQL file.
@@ -134,12 +240,17 @@ def backup_database(
         zip: If True, compress the output as a .zip archive (the .sql is removed).
         includes: If set, dump only these tables. Mutually exclusive with *excludes*.
         excludes: If set, dump all tables except these.
+        jobs: Number of worker processes dumping tables in parallel. With more
+            than one, each worker reads its tables from its own snapshot, so
+            the dump is no longer consistent across tables.
 
     Returns:
-        The actual path the backup was written to (.sql or .zip).
+        The actual path the backup was written to (.sql, .sql.gz or .zip).
     """
     if includes and excludes:
         raise BackupError(ERR_INCLUDE_EXCLUDE_MUTUAL)
+    if zip and output_path.suffix.lower() == GZ_EXT:
+        raise BackupError(ERR_ZIP_WITH_GZ_PATH)
 
     if incremental is not None:
         actual_path = resolve_incremental_path(output_path)
@@ -154,21 +265,22 @@ def backup_database(
 
     actual_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with DatabaseConnection(config) as db:
+    # One consistent snapshot for the whole dump, so all tables are read
+    # from the same point in time (parallel workers each take their own).
+    with DatabaseConnection(config, snapshot=True) as db:
         tables = _filter_tables(db.get_tables(), includes, excludes)
 
-        with open(actual_path, "w", encoding="utf-8") as f:
+        with _open_output(actual_path) as f:
             now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
-            f.write(SQL_HEADER.format(database=config.database, date=now))
-
-            for table in tables:
-                f.write(SQL_DROP_TABLE.format(table=table))
-
-                ddl = db.get_create_table(table)
-                f.write(ddl)
-                f.write(";\n\n")
-
-                _write_table_data(f, db, table, batch_size=batch_size)
+            f.write(SQL_HEADER % (config.database.encode(), now.encode()))
+
+            if jobs > 1 and len(tables) >= PARALLEL_MIN_TABLES:
+                _dump_tables_parallel(
+                    f, config, tables, batch_size, jobs, work_dir=actual_path.parent
+                )
+            else:
+                for table in tables:
+                    _dump_table(f, db, table, batch_size=batch_size)
 
             f.write(SQL_FOOTER)
 
@@ -14,6 +14,8 @@ from sqlbackup.constants import (
     ERR_FILTERS_REQUIRE_BACKUP_OR_COPY,
     ERR_FORCE_REQUIRES_PUSH_OR_COPY,
     ERR_INCLUDE_EXCLUDE_MUTUAL,
+    ERR_JOBS_NOT_POSITIVE,
+    ERR_JOBS_REQUIRES_BACKUP,
     ERR_ZIP_REQUIRES_BACKUP,
 )
 from sqlbackup.copy import copy_database
@@ -49,6 +51,13 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Compress backup as .zip (only with --backup; --push auto-detects .zip)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Dump tables in N parallel processes (only with --backup; "
+        "tables are then not read from one shared snapshot)",
+    )
     parser.add_argument(
         "--include-table",
         action="append",
@@ -75,6 +84,10 @@ def _build_parser() -> argparse.ArgumentParser:
 def _validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
     if args.zip and not args.backup:
         parser.error(ERR_ZIP_REQUIRES_BACKUP)
+    if args.jobs != 1 and not args.backup:
+        parser.error(ERR_JOBS_REQUIRES_BACKUP)
+    if args.jobs < 1:
+        parser.error(ERR_JOBS_NOT_POSITIVE)
     if args.include_tables and args.exclude_tables:
         parser.error(ERR_INCLUDE_EXCLUDE_MUTUAL)
     if (args.include_tables or args.exclude_tables) and not (args.backup or args.copy):
@@ -110,6 +123,7 @@ def main() -> None:
                 zip=args.zip,
                 includes=args.include_tables,
                 excludes=args.exclude_tables,
+                jobs=args.jobs,
             )
             print(f"Backup complete: {actual_path}")
         elif args.push:
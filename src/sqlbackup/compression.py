@@ -0,0 +1,18 @@
+"""Gzip file access shared by backup and push."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from typing import IO, Literal, cast
+
+from sqlbackup.constants import GZIP_COMPRESS_LEVEL
+
+
+def open_gzip(path: Path, mode: Literal["rb", "wb"]) -> IO[bytes]:
+    """Open a gzip file as a binary stream, compressing at ``GZIP_COMPRESS_LEVEL``.
+
+    GzipFile is a binary file object; typeshed just doesn't declare it as
+    IO[bytes].
+    """
+    return cast(IO[bytes], gzip.open(path, mode, compresslevel=GZIP_COMPRESS_LEVEL))
@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 import pymysql
 import pymysql.cursors
+from pymysql.constants import CLIENT
 
 from sqlbackup.config import DbConfig
-from sqlbackup.constants import ERR_CONNECTION_FAILED
+from sqlbackup.constants import DEFAULT_COMMIT_EVERY, ERR_CONNECTION_FAILED, SESSION_INIT_SQL
 from sqlbackup.exceptions import ConnectionError
 
 
 class DatabaseConnection:
-    """Context-managed database connection."""
+    """Context-managed database connection.
 
-    def __init__(self, config: DbConfig) -> None:
+    With ``snapshot=True`` the session opens a REPEATABLE READ transaction
+    WITH CONSISTENT SNAPSHOT on connect (like ``mysqldump
+    --single-transaction``), so every later read sees the same InnoDB view.
+    ``multi_statements=True`` lets one query string carry several
+    ``;``-separated statements.
+    """
+
+    def __init__(
+        self, config: DbConfig, *, snapshot: bool = False, multi_statements: bool = False
+    ) -> None:
         self._config = config
+        self._snapshot = snapshot
+        self._multi_statements = multi_statements
         self._conn: pymysql.connections.Connection[Any] | None = None
+        self._descriptions: dict[str, tuple[tuple[Any, ...], ...]] = {}
 
     def __enter__(self) -> DatabaseConnection:
         try:
@@ -31,9 +45,15 @@ class DatabaseConnection:
                 read_timeout=600,
                 write_timeout=600,
                 max_allowed_packet=64 * 1024 * 1024,
+                init_command=SESSION_INIT_SQL,
+                client_flag=CLIENT.MULTI_STATEMENTS if self._multi_statements else 0,
             )
         except Exception as exc:
             raise ConnectionError(ERR_CONNECTION_FAILED.format(error=exc)) from exc
+        if self._snapshot:
+            with self._conn.cursor() as cursor:
+                cursor.execute("SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
         return self
 
     def __exit__(self, *args: object) -> None:
@@ -58,11 +78,21 @@ class DatabaseConnection:
             row = cursor.fetchone()
             return str(row[1])
 
+    def _describe(self, table: str) -> tuple[tuple[Any, ...], ...]:
+        """Return the cursor description of a table, querying it only once."""
+        if table not in self._descriptions:
+            with self.conn.cursor() as cursor:
+                cursor.execute(f"SELECT * FROM `{table}` LIMIT 0")
+                self._descriptions[table] = tuple(cursor.description)
+        return self._descriptions[table]
+
     def get_column_names(self, table: str) -> list[str]:
         """Return column names for a table."""
-        with self.conn.cursor() as cursor:
-            cursor.execute(f"SELECT * FROM `{table}` LIMIT 0")
-            return [desc[0] for desc in cursor.description]
+        return [desc[0] for desc in self._describe(table)]
+
+    def get_column_type_codes(self, table: str) -> list[int]:
+        """Return pymysql FIELD_TYPE codes for a table's columns."""
+        return [desc[1] for desc in self._describe(table)]
 
     def iter_rows(self, table: str, batch_size: int = 1000) -> Any:
         """Yield batches of rows from a table using server-side cursor."""
@@ -79,3 +109,22 @@ class DatabaseConnection:
         with self.conn.cursor() as cursor:
             cursor.execute(sql)
         self.conn.commit()
+
+    def execute_many(
+        self, statements: Iterable[str], commit_every: int = DEFAULT_COMMIT_EVERY
+    ) -> None:
+        """Execute SQL statements on one cursor, committing every *commit_every*.
+
+        A final commit follows the last statement. On a ``multi_statements``
+        connection an item may hold several statements; the results of all
+        of them are read (raising on the first error) before the next item.
+        """
+        with self.conn.cursor() as cursor:
+            for i, sql in enumerate(statements, 1):
+                cursor.execute(sql)
+                if self._multi_statements:
+                    while cursor.nextset():
+                        pass
+                if i % commit_every == 0:
+                    self.conn.commit()
+        self.conn.commit()
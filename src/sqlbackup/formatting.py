@@ -0,0 +1,141 @@
+"""SQL literal formatting for dumped rows."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from pymysql.constants import FIELD_TYPE
+
+# Keyed on the exact type, so bool gets its own entry rather than matching int.
+_VALUE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda _: "NULL",
+    bool: lambda v: "1" if v else "0",
+    int: str,
+    float: repr,
+    bytes: lambda v: f"X'{v.hex()}'",
+}
+
+
+def format_value(value: Any) -> str:
+    """Format a Python value as a SQL literal.
+
+    Any type without an entry in ``_VALUE_FORMATTERS`` (str, Decimal,
+    datetime, ...) is written as a quoted string.
+    """
+    fmt = _VALUE_FORMATTERS.get(type(value))
+    if fmt is not None:
+        return fmt(value)
+    return f"'{_escape(str(value))}'"
+
+
+def _escape(s: str) -> str:
+    """Backslash-escape ``\\`` and ``'`` for a single-quoted SQL literal.
+
+    Most values contain neither character, so check first and return *s*
+    itself instead of building two copies.
+    """
+    if "\\" in s or "'" in s:
+        return s.replace("\\", "\\\\").replace("'", "\\'")
+    return s
+
+
+ColumnFormatter = Callable[[Sequence[Any]], list[str]]
+
+
+def _fmt_int(col: Sequence[Any]) -> list[str]:
+    """Format an integer column."""
+    if None in col:
+        return ["NULL" if v is None else str(v) for v in col]
+    return list(map(str, col))
+
+
+def _fmt_float(col: Sequence[Any]) -> list[str]:
+    """Format a FLOAT/DOUBLE column."""
+    if None in col:
+        return ["NULL" if v is None else repr(v) for v in col]
+    return list(map(repr, col))
+
+
+def _fmt_bytes(col: Sequence[Any]) -> list[str]:
+    """Format a column that is always returned as bytes (BIT, GEOMETRY)."""
+    return ["NULL" if v is None else f"X'{v.hex()}'" for v in col]
+
+
+def _fmt_str(col: Sequence[Any]) -> list[str]:
+    """Format a text column.
+
+    TEXT and BLOB share type codes, so non-str values (bytes from binary
+    columns, NULL) fall back to :func:`format_value`.
+    """
+    # Same check as _escape(), inlined to save a call per cell.
+    return [
+        format_value(v)
+        if type(v) is not str
+        else f"'{v}'"
+        if "\\" not in v and "'" not in v
+        else "'" + v.replace("\\", "\\\\").replace("'", "\\'") + "'"
+        for v in col
+    ]
+
+
+def _fmt_any(col: Sequence[Any]) -> list[str]:
+    """Format a column of any other type value by value."""
+    return list(map(format_value, col))
+
+
+_COLUMN_FORMATTERS: dict[int, ColumnFormatter] = {
+    FIELD_TYPE.TINY: _fmt_int,
+    FIELD_TYPE.SHORT: _fmt_int,
+    FIELD_TYPE.LONG: _fmt_int,
+    FIELD_TYPE.INT24: _fmt_int,
+    FIELD_TYPE.LONGLONG: _fmt_int,
+    FIELD_TYPE.YEAR: _fmt_int,
+    FIELD_TYPE.FLOAT: _fmt_float,
+    FIELD_TYPE.DOUBLE: _fmt_float,
+    FIELD_TYPE.BIT: _fmt_bytes,
+    FIELD_TYPE.GEOMETRY: _fmt_bytes,
+    FIELD_TYPE.VARCHAR: _fmt_str,
+    FIELD_TYPE.VAR_STRING: _fmt_str,
+    FIELD_TYPE.STRING: _fmt_str,
+    FIELD_TYPE.JSON: _fmt_str,
+    FIELD_TYPE.TINY_BLOB: _fmt_str,
+    FIELD_TYPE.MEDIUM_BLOB: _fmt_str,
+    FIELD_TYPE.LONG_BLOB: _fmt_str,
+    FIELD_TYPE.BLOB: _fmt_str,
+}
+
+
+def column_formatters(type_codes: list[int]) -> list[ColumnFormatter]:
+    """Pick a column formatter for each pymysql FIELD_TYPE code."""
+    return [_COLUMN_FORMATTERS.get(t, _fmt_any) for t in type_codes]
+
+
+# Columns whose values %-format directly to their SQL literal.
+_RAW_SPECS: dict[ColumnFormatter, str] = {_fmt_int: "%d", _fmt_float: "%r"}
+
+
+def format_rows(
+    batch: Sequence[tuple[Any, ...]],
+    formatters: list[ColumnFormatter],
+) -> list[str]:
+    """Format a batch of rows as ``(v1, v2, ...)`` SQL tuples.
+
+    Numeric columns without NULLs in this batch are left as they are and
+    rendered by a per-batch ``%`` row template (``%d``/``%r``), one C-level
+    call per row. All other columns are formatted column-wise by their
+    formatter and inserted with ``%s``.
+    """
+    columns: list[Sequence[Any]] = list(zip(*batch, strict=True))
+    specs: list[str] = []
+    raw = True
+    for i, (fmt, col) in enumerate(zip(formatters, columns, strict=True)):
+        spec = _RAW_SPECS.get(fmt)
+        if spec is None or None in col:
+            columns[i] = fmt(col)
+            spec = "%s"
+            raw = False
+        specs.append(spec)
+    template = f"({', '.join(specs)})"
+    rows = batch if raw else zip(*columns, strict=True)
+    return list(map(template.__mod__, rows))
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import contextlib
-import tempfile
+import re
 import zipfile
+from collections.abc import Generator, Iterable, Iterator
 from pathlib import Path
+from typing import IO
 
+from sqlbackup.compression import open_gzip
 from sqlbackup.config import DbConfig
 from sqlbackup.connection import DatabaseConnection
 from sqlbackup.constants import (
@@ -14,85 +17,268 @@ from sqlbackup.constants import (
     ERR_PUSH_TARGET_NOT_EMPTY,
     ERR_PUSH_ZIP_MULTIPLE_SQL,
     ERR_PUSH_ZIP_NO_SQL,
+    GZ_EXT,
+    INSERT_GROUP_BYTES,
+    INSERT_GROUP_SIZE,
+    INSERT_MERGE_STATEMENT_BYTES,
+    READ_CHUNK_SIZE,
     SQL_EXT,
     ZIP_EXT,
 )
 from sqlbackup.exceptions import PushError
 
+# One step of the scan: a run of statement text, with quoted strings,
+# backtick identifiers and ``/*! ... */``, MariaDB ``/*M! ... */`` and
+# ``/*+ ... */`` comments (which the server executes) consumed whole, so
+# semicolons inside them are ignored, up to whatever ends the run: a
+# semicolon, a ``--`` or ``#`` line comment or a plain block comment.
+# Anything left open at EOF runs to the end.
+_STATEMENT_STEP_RE = re.compile(
+    rb"(?:[^';\"`/#-]+"
+    rb"|'[^'\\]*(?:\\.?[^'\\]*)*(?:'|\Z)"
+    rb"|\"[^\"\\]*(?:\\.?[^\"\\]*)*(?:\"|\Z)"
+    rb"|`[^`]*(?:`|\Z)"
+    rb"|/\*(?:M?!|\+).*?(?:\*/|\Z)"
+    rb"|/(?!\*)"
+    rb"|-(?!-(?:\s|\Z)))*"
+    rb"(?:(;)|(--[^\n]*|#[^\n]*)|(/\*.*?(?:\*/|\Z)))?",
+    re.DOTALL,
+)
+_SEMICOLON = 1
+_BLOCK_COMMENT = 3
+# Any of these before a semicolon may hide it or need dropping, so the
+# quick count-based check can't vouch for it.
+_SLOW_PATH_MARKERS = (b'"', b"--", b"#", b"/*")
+# Upper-cased first 7 bytes of a statement that is an INSERT. A set lookup
+# is about half the cost of a regex match per statement; an INSERT whose
+# head isn't listed is merely not grouped.
+_INSERT_HEADS = frozenset(b"INSERT" + ws for ws in (b" ", b"\t", b"\n", b"\r"))
+
+# ``INSERT [IGNORE] INTO tbl [(cols)] VALUES`` up to the first row tuple.
+_INSERT_PREFIX_RE = re.compile(
+    rb"INSERT\s+(?:IGNORE\s+)?INTO\s+(?:`[^`]*`|\w+)(?:\.(?:`[^`]*`|\w+))?\s*"
+    rb"(?:\([^()]*\)\s*)?VALUES?\s*",
+    re.IGNORECASE,
+)
+# A comma-separated list of row tuples and nothing else (so no ON DUPLICATE
+# KEY UPDATE, AS alias or RETURNING tail). Only literals are accepted as
+# values: numbers, NULL/TRUE/FALSE, hex and bit literals and single-quoted
+# strings with an optional _charset introducer. An expression such as
+# LAST_INSERT_ID() or a subquery can evaluate differently once its row
+# shares a statement with others, so such INSERTs are left alone.
+# Possessive quantifiers keep a failed match from backtracking.
+_LITERAL = (
+    rb"(?:NULL|TRUE|FALSE"
+    rb"|[+-]?+(?:\d++(?:\.\d*+)?+|\.\d++)(?:e[+-]?+\d++)?+"
+    rb"|0x[0-9a-f]++|x'[0-9a-f]*+'|0b[01]++|b'[01]*+'"
+    rb"|(?:_\w++\s*+)?+'[^'\\]*+(?:(?:\\.|'')[^'\\]*+)*+')"
+)
+_ROW_TUPLE = rb"\(\s*+%b(?:\s*+,\s*+%b)*+\s*+\)" % (_LITERAL, _LITERAL)
+_ROW_LIST_RE = re.compile(
+    rb"%b(?:\s*+,\s*+%b)*+" % (_ROW_TUPLE, _ROW_TUPLE), re.DOTALL | re.IGNORECASE
+)
+
+
+def _ends_statement(buf: bytearray, pos: int, stop: int) -> bool:
+    """Tell from byte counts alone whether ``buf[pos:stop]`` is a whole statement.
+
+    True when the text holds no double quotes or comment markers, any
+    backticks come before the first single quote and pair up, and the
+    single quotes pair up with no backslash escapes among them. That
+    covers DDL and most INSERTs, using only memchr-speed scans. False
+    means the regex step has to decide.
+    """
+    if any(buf.find(marker, pos, stop) >= 0 for marker in _SLOW_PATH_MARKERS):
+        return False
+    quote = buf.find(b"'", pos, stop)
+    if quote < 0:
+        return buf.count(b"`", pos, stop) % 2 == 0
+    return (
+        buf.find(b"\\", quote, stop) < 0
+        and buf.find(b"`", quote, stop) < 0
+        and buf.count(b"`", pos, quote) % 2 == 0
+        and buf.count(b"'", quote, stop) % 2 == 0
+    )
+
+
+def _parse_statements(f: IO[bytes]) -> Generator[bytes, None, None]:
+    """Yield the individual statements read from the binary stream *f*.
+
+    The stream is read in ``READ_CHUNK_SIZE`` chunks, so memory use is
+    bounded by the chunk size plus about twice the longest statement. Statements are
+    split on semicolons outside quoted strings (e.g. serialized PHP data),
+    backtick identifiers and executable comments; other comments and
+    surrounding whitespace are dropped.
+    """
+    buf = bytearray()
+    current = bytearray()
+    pos = 0
+    eof = False
+    while not eof:
+        # Dropping a bytearray prefix just moves its start; nothing is copied.
+        del buf[:pos]
+        # An unfinished statement is scanned again from its start, so read
+        # at least as much as is pending: the rescans then add up to about
+        # twice the statement instead of growing with its square.
+        chunk = f.read(max(READ_CHUNK_SIZE, len(buf)))
+        eof = not chunk
+        buf += chunk
+        pos = 0
+        end = len(buf)
+        while pos < end:
+            semi = buf.find(b";", pos)
+            if semi < 0 and not eof:
+                break
+            stop = end if semi < 0 else semi
+            if _ends_statement(buf, pos, stop):
+                current += buf[pos:stop]
+                pos = stop + 1
+                if semi < 0:
+                    break
+            else:
+                match = _STATEMENT_STEP_RE.match(buf, pos)
+                assert match is not None  # the pattern also matches empty text
+                kind = match.lastindex
+                if kind != _SEMICOLON and match.end() == end and not eof:
+                    # The literal or comment may go on in the next chunk.
+                    break
+                current += buf[pos : match.end() if kind is None else match.start(kind)]
+                pos = match.end()
+                if kind == _BLOCK_COMMENT:
+                    # Keep the tokens on either side apart.
+                    current += b" "
+                if kind != _SEMICOLON:
+                    continue
+            stmt = current.strip()
+            if stmt:
+                yield bytes(stmt)
+            current.clear()
+    stmt = current.strip()
+    if stmt:
+        yield bytes(stmt)
+
+
+def _split_insert(stmt: bytes) -> tuple[bytes, bytes] | None:
+    """Split a small single-table INSERT into its prefix and its row tuples.
+
+    Returns None for anything that can't be merged with a neighbour.
+    """
+    if len(stmt) > INSERT_MERGE_STATEMENT_BYTES:
+        return None
+    match = _INSERT_PREFIX_RE.match(stmt)
+    if match is None or _ROW_LIST_RE.fullmatch(stmt, match.end()) is None:
+        return None
+    return stmt[: match.end()], stmt[match.end() :]
+
+
+def _merge_inserts(statements: Iterable[bytes]) -> Iterator[bytes]:
+    """Merge runs of INSERTs into the same table into multi-row INSERTs.
+
+    Neighbours whose text up to the row tuples is byte-for-byte identical
+    become one ``INSERT ... VALUES (..),(..)`` of at most
+    ``INSERT_GROUP_BYTES``, so the server parses one statement for many
+    rows. Everything else passes through unchanged.
+    """
+    prefix = b""
+    rows: list[bytes] = []
+    size = 0
+    for stmt in statements:
+        parts = _split_insert(stmt)
+        if rows and (
+            parts is None or parts[0] != prefix or size + len(parts[1]) > INSERT_GROUP_BYTES
+        ):
+            yield prefix + b",".join(rows)
+            rows.clear()
+        if parts is None:
+            yield stmt
+            continue
+        if not rows:
+            prefix = parts[0]
+            size = len(prefix)
+        rows.append(parts[1])
+        size += len(parts[1]) + 1
+    if rows:
+        yield prefix + b",".join(rows)
+
 
-def _parse_statements(sql_path: Path) -> list[str]:
-    """Parse a SQL file into individual statements.
+def _group_inserts(statements: Iterable[bytes]) -> Iterator[bytes]:
+    """Join runs of consecutive INSERTs into multi-statement queries.
 
-    Handles multi-line statements terminated by semicolons.
-    Skips comments and blank lines.
-    Tracks single-quote state so semicolons inside string literals
-    (e.g. serialized PHP data) are not treated as statement boundaries.
+    Groups hold at most ``INSERT_GROUP_SIZE`` statements and about
+    ``INSERT_GROUP_BYTES`` of SQL. Any other statement (DDL, SET, ...)
+    ends the current group and is yielded on its own.
     """
-    statements: list[str] = []
-    current: list[str] = []
-    in_string = False
-
-    with open(sql_path, encoding="utf-8") as f:
-        for line in f:
-            stripped = line.strip()
-
-            if not in_string and (not stripped or stripped.startswith("--")):
-                continue
-
-            current.append(stripped)
-
-            # Track single-quote state to find real statement boundaries
-            i = 0
-            while i < len(stripped):
-                c = stripped[i]
-                if in_string:
-                    if c == "\\":
-                        i += 2  # skip escaped character
-                        continue
-                    if c == "'":
-                        in_string = False
-                else:
-                    if c == "'":
-                        in_string = True
-                i += 1
-
-            if not in_string and stripped.endswith(";"):
-                stmt = "\n".join(current)
-                stmt = stmt.rstrip(";")
-                statements.append(stmt)
-                current = []
-
-    return statements
-
-
-def _extract_sql_from_zip(zip_path: Path, dest_dir: Path) -> Path:
-    """Extract a single .sql member from *zip_path* into *dest_dir*.
+    group: list[bytes] = []
+    size = 0
+    for stmt in statements:
+        if stmt[:7].upper() not in _INSERT_HEADS:
+            if group:
+                yield b";\n".join(group)
+                group.clear()
+                size = 0
+            yield stmt
+            continue
+        if group and (len(group) == INSERT_GROUP_SIZE or size + len(stmt) > INSERT_GROUP_BYTES):
+            yield b";\n".join(group)
+            group.clear()
+            size = 0
+        group.append(stmt)
+        size += len(stmt)
+    if group:
+        yield b";\n".join(group)
+
+
+def _open_zip_member(zf: zipfile.ZipFile, zip_path: Path) -> IO[bytes]:
+    """Open the single .sql member of *zf* for reading.
 
     Raises PushError if the archive contains zero or multiple .sql files.
     """
-    with zipfile.ZipFile(zip_path) as zf:
-        sql_members = [n for n in zf.namelist() if n.lower().endswith(SQL_EXT)]
-        if not sql_members:
-            raise PushError(ERR_PUSH_ZIP_NO_SQL.format(path=zip_path))
-        if len(sql_members) > 1:
-            raise PushError(ERR_PUSH_ZIP_MULTIPLE_SQL.format(path=zip_path))
-        return Path(zf.extract(sql_members[0], dest_dir))
+    sql_members = [n for n in zf.namelist() if n.lower().endswith(SQL_EXT)]
+    if not sql_members:
+        raise PushError(ERR_PUSH_ZIP_NO_SQL.format(path=zip_path))
+    if len(sql_members) > 1:
+        raise PushError(ERR_PUSH_ZIP_MULTIPLE_SQL.format(path=zip_path))
+    return zf.open(sql_members[0])
 
 
-def push_database(config: DbConfig, sql_path: Path, *, force: bool = False) -> None:
-    """Restore a .sql dump file to a database.
+@contextlib.contextmanager
+def _open_sql_stream(source: Path | IO[bytes]) -> Iterator[IO[bytes]]:
+    """Yield a binary stream of the SQL text in *source*.
 
-    If *sql_path* ends in ``.zip``, the archive is extracted to a temp dir and
-    the contained ``.sql`` file is restored.
+    A ``.zip`` or ``.gz`` path is decompressed while it is read; nothing is
+    extracted to disk. A stream is passed through and left open.
+    """
+    if not isinstance(source, Path):
+        yield source
+        return
+    suffix = source.suffix.lower()
+    if suffix == ZIP_EXT:
+        with zipfile.ZipFile(source) as zf, _open_zip_member(zf, source) as f:
+            yield f
+    elif suffix == GZ_EXT:
+        with open_gzip(source, "rb") as f:
+            yield f
+    else:
+        with open(source, "rb") as f:
+            yield f
+
+
+def push_database(config: DbConfig, source: Path | IO[bytes], *, force: bool = False) -> None:
+    """Restore a .sql dump to a database.
+
+    If *source* is a path ending in ``.zip``, the contained ``.sql`` file is
+    restored straight from the archive. A ``.gz`` file is decompressed the
+    same way. A binary stream is read as plain SQL.
 
     Args:
         config: Database connection configuration.
-        sql_path: Path to the SQL dump file (or a .zip containing one).
+        source: Path to the SQL dump file (or a .zip/.gz containing one), or
+            an open binary stream of SQL text.
         force: If False (default), refuse to push to a target DB that already
             has tables. Set True to overwrite an existing schema.
     """
-    if not sql_path.exists():
-        raise PushError(ERR_PUSH_FILE_NOT_FOUND.format(path=sql_path))
+    if isinstance(source, Path) and not source.exists():
+        raise PushError(ERR_PUSH_FILE_NOT_FOUND.format(path=source))
 
     if not force:
         with DatabaseConnection(config) as db:
@@ -102,20 +288,22 @@ def push_database(config: DbConfig, sql_path: Path, *, force: bool = False) -> N
                 ERR_PUSH_TARGET_NOT_EMPTY.format(db=config.database, count=len(existing))
             )
 
-    if sql_path.suffix.lower() == ZIP_EXT:
-        with tempfile.TemporaryDirectory() as td:
-            extracted = _extract_sql_from_zip(sql_path, Path(td))
-            statements = _parse_statements(extracted)
-    else:
-        statements = _parse_statements(sql_path)
-
-    # Increase server max_allowed_packet (requires SUPER/SYSTEM_VARIABLES_ADMIN).
-    # New connections pick up the global value, so we do this before the main connection.
-    with DatabaseConnection(config) as db, contextlib.suppress(Exception):
-        db.execute_sql("SET GLOBAL max_allowed_packet = 67108864")
-
-    with DatabaseConnection(config) as db:
-        db.execute_sql("SET SESSION net_read_timeout = 600")
-        db.execute_sql("SET SESSION net_write_timeout = 600")
-        for stmt in statements:
-            db.execute_sql(stmt)
+    with (
+        _open_sql_stream(source) as sql_file,
+        contextlib.closing(_parse_statements(sql_file)) as statements,
+    ):
+        # Increase server max_allowed_packet (requires SUPER/SYSTEM_VARIABLES_ADMIN).
+        # New connections pick up the global value, so we do this before the main connection.
+        with DatabaseConnection(config) as db, contextlib.suppress(Exception):
+            db.execute_sql("SET GLOBAL max_allowed_packet = 67108864")
+
+        # Statements are parsed lazily, so parsing overlaps with execution and
+        # the dump is never held in memory as a whole. Grouping INSERTs saves
+        # a round trip per statement on dumps with many small ones. A group
+        # already holds up to INSERT_GROUP_SIZE statements, so commit after
+        # each one to keep transactions that size rather than 500 groups.
+        with DatabaseConnection(config, multi_statements=True) as db:
+            db.execute_many(
+                (query.decode() for query in _group_inserts(_merge_inserts(statements))),
+                commit_every=1,
+            )
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import re
-import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pymysql.constants import FIELD_TYPE
 
-from sqlbackup.backup import backup_database, cleanup_old_backups, resolve_incremental_path
+from sqlbackup.backup import _prefetched, backup_database
 from sqlbackup.config import DbConfig
 from sqlbackup.exceptions import BackupError
 
@@ -34,10 +35,11 @@ class TestBackupDatabase:
         mock_db_conn.get_tables.return_value = []
         output = tmp_path / "dump.sql"
 
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn) as mock_cls:
             backup_database(db_config, output)
 
         assert output.exists()
+        mock_cls.assert_called_once_with(db_config, snapshot=True)
 
     def test_raises_if_file_exists(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
@@ -62,6 +64,8 @@ class TestBackupDatabase:
 
         content = output.read_text(encoding="utf-8")
         assert "SET FOREIGN_KEY_CHECKS = 0;" in content
+        assert "SET UNIQUE_CHECKS = 0;" in content
+        assert "-- Database: testdb\n" in content
 
     def test_footer_contains_fk_enable(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
@@ -74,6 +78,7 @@ class TestBackupDatabase:
 
         content = output.read_text(encoding="utf-8")
         assert "SET FOREIGN_KEY_CHECKS = 1;" in content
+        assert "SET UNIQUE_CHECKS = 1;" in content
 
     def test_dumps_drop_and_create(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
@@ -91,6 +96,24 @@ class TestBackupDatabase:
         assert "DROP TABLE IF EXISTS `users`;" in content
         assert "CREATE TABLE `users` (id INT);" in content
 
+    def test_empty_table_writes_no_insert(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_db_conn.get_tables.return_value = ["users"]
+        mock_db_conn.get_create_table.return_value = "CREATE TABLE `users` (id INT)"
+        mock_db_conn.get_column_names.return_value = ["id"]
+        mock_db_conn.iter_rows.return_value = iter([])
+        output = tmp_path / "dump.sql"
+
+        with (
+            patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn),
+            patch("sqlbackup.backup._prefetched") as mock_prefetched,
+        ):
+            backup_database(db_config, output)
+
+        assert "INSERT" not in output.read_text(encoding="utf-8")
+        mock_prefetched.assert_not_called()
+
     def test_dumps_insert_statements(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
     ) -> None:
@@ -98,6 +121,7 @@ class TestBackupDatabase:
         create_ddl = "CREATE TABLE `users` (id INT, name VARCHAR(50))"
         mock_db_conn.get_create_table.return_value = create_ddl
         mock_db_conn.get_column_names.return_value = ["id", "name"]
+        mock_db_conn.get_column_type_codes.return_value = [FIELD_TYPE.LONG, FIELD_TYPE.VAR_STRING]
         mock_db_conn.iter_rows.return_value = iter(
             [
                 [(1, "alice"), (2, "bob")],
@@ -120,6 +144,7 @@ class TestBackupDatabase:
         create_ddl = "CREATE TABLE `users` (id INT, name VARCHAR(50))"
         mock_db_conn.get_create_table.return_value = create_ddl
         mock_db_conn.get_column_names.return_value = ["id", "name"]
+        mock_db_conn.get_column_type_codes.return_value = [FIELD_TYPE.LONG, FIELD_TYPE.VAR_STRING]
         mock_db_conn.iter_rows.return_value = iter(
             [
                 [(1, None)],
@@ -140,6 +165,7 @@ class TestBackupDatabase:
         create_ddl = "CREATE TABLE `users` (id INT, name VARCHAR(50))"
         mock_db_conn.get_create_table.return_value = create_ddl
         mock_db_conn.get_column_names.return_value = ["id", "name"]
+        mock_db_conn.get_column_type_codes.return_value = [FIELD_TYPE.LONG, FIELD_TYPE.VAR_STRING]
         mock_db_conn.iter_rows.return_value = iter(
             [
                 [(1, "O'Brien")],
@@ -159,6 +185,7 @@ class TestBackupDatabase:
         mock_db_conn.get_tables.return_value = ["data"]
         mock_db_conn.get_create_table.return_value = "CREATE TABLE `data` (id INT, blob_col BLOB)"
         mock_db_conn.get_column_names.return_value = ["id", "blob_col"]
+        mock_db_conn.get_column_type_codes.return_value = [FIELD_TYPE.LONG, FIELD_TYPE.BLOB]
         mock_db_conn.iter_rows.return_value = iter(
             [
                 [(1, b"\x00\x01\x02")],
@@ -203,178 +230,96 @@ class TestBackupDatabase:
         assert output.exists()
 
 
-class TestResolveIncrementalPath:
-    def test_prepends_timestamp(self, tmp_path: Path) -> None:
-        base = tmp_path / "db.sql"
-        result = resolve_incremental_path(base)
-        assert result.parent == tmp_path
-        assert re.match(r"^\d{8}_\d{6}_db\.sql$", result.name)
-
-    def test_preserves_directory(self, tmp_path: Path) -> None:
-        base = tmp_path / "sub" / "db.sql"
-        result = resolve_incremental_path(base)
-        assert result.parent == tmp_path / "sub"
-
-
-class TestCleanupOldBackups:
-    def test_keeps_n_most_recent(self, tmp_path: Path) -> None:
-        for i in range(5):
-            (tmp_path / f"2026010{i}_120000_db.sql").write_text("")
-        cleanup_old_backups(tmp_path / "db.sql", keep=3)
-        remaining = sorted(tmp_path.glob("*_db.sql"))
-        assert len(remaining) == 3
-        assert remaining[0].name == "20260102_120000_db.sql"
-
-    def test_no_delete_when_fewer_than_keep(self, tmp_path: Path) -> None:
-        for i in range(2):
-            (tmp_path / f"2026010{i}_120000_db.sql").write_text("")
-        cleanup_old_backups(tmp_path / "db.sql", keep=5)
-        remaining = list(tmp_path.glob("*_db.sql"))
-        assert len(remaining) == 2
-
-    def test_does_not_touch_unrelated_files(self, tmp_path: Path) -> None:
-        (tmp_path / "20260101_120000_db.sql").write_text("")
-        (tmp_path / "20260102_120000_other.sql").write_text("")
-        cleanup_old_backups(tmp_path / "db.sql", keep=1)
-        assert (tmp_path / "20260101_120000_db.sql").exists()
-        assert (tmp_path / "20260102_120000_other.sql").exists()
-
-
-class TestIncrementalBackup:
-    @pytest.fixture()
-    def db_config(self) -> DbConfig:
-        return DbConfig(
-            host="localhost", port=3306, user="root", password="secret", database="testdb"
-        )
+class TestPrefetched:
+    def test_yields_all_items_in_order(self) -> None:
+        assert list(_prefetched(iter([[1], [2], [3]]))) == [[1], [2], [3]]
 
-    @pytest.fixture()
-    def mock_db_conn(self) -> MagicMock:
-        mock = MagicMock()
-        mock.__enter__ = MagicMock(return_value=mock)
-        mock.__exit__ = MagicMock(return_value=False)
-        mock.get_tables.return_value = []
-        return mock
+    def test_propagates_fetch_errors(self) -> None:
+        def batches() -> Iterator[list[int]]:
+            yield [1]
+            raise RuntimeError("lost connection")
 
-    def test_creates_timestamped_file(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
-        base = tmp_path / "db.sql"
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
-            actual = backup_database(db_config, base, incremental=5)
-        assert re.match(r"^\d{8}_\d{6}_db\.sql$", actual.name)
-        assert actual.exists()
+        result = _prefetched(batches())
+        assert next(result) == [1]
+        with pytest.raises(RuntimeError, match="lost connection"):
+            next(result)
 
-    def test_does_not_error_when_base_exists(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
-        base = tmp_path / "db.sql"
-        base.write_text("existing")
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
-            actual = backup_database(db_config, base, incremental=5)
-        assert actual.exists()
-        assert actual != base
 
-    def test_cleanup_runs_after_backup(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
-        for i in range(5):
-            (tmp_path / f"2026010{i}_120000_db.sql").write_text("")
-        base = tmp_path / "db.sql"
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
-            backup_database(db_config, base, incremental=3)
-        remaining = list(tmp_path.glob("*_db.sql"))
-        assert len(remaining) == 3
+class TestParallelBackup:
+    TABLES = ["a", "b", "c", "d"]
 
-
-class TestZipBackup:
-    @pytest.fixture()
-    def db_config(self) -> DbConfig:
-        return DbConfig(
-            host="localhost", port=3306, user="root", password="secret", database="testdb"
-        )
+    @pytest.fixture(autouse=True)
+    def fresh_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # The pool runs on threads here, so workers share this process's state.
+        monkeypatch.setattr("sqlbackup.backup._worker_db", None)
 
     @pytest.fixture()
     def mock_db_conn(self) -> MagicMock:
         mock = MagicMock()
         mock.__enter__ = MagicMock(return_value=mock)
         mock.__exit__ = MagicMock(return_value=False)
-        mock.get_tables.return_value = []
+        mock.get_tables.return_value = self.TABLES
+        mock.get_create_table.side_effect = lambda t: f"CREATE TABLE `{t}` (id INT)"
+        mock.get_column_names.return_value = ["id"]
+        mock.get_column_type_codes.return_value = [FIELD_TYPE.LONG]
+        mock.iter_rows.side_effect = lambda t, batch_size: iter([[(self.TABLES.index(t),)]])
         return mock
 
-    def test_creates_zip_and_removes_sql(
+    def _backup(self, db_config: DbConfig, mock_db_conn: MagicMock, output: Path, jobs: int) -> str:
+        with (
+            patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn),
+            patch("sqlbackup.backup.ProcessPoolExecutor", ThreadPoolExecutor),
+        ):
+            backup_database(db_config, output, jobs=jobs)
+        return output.read_text()
+
+    def test_matches_sequential_dump(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
     ) -> None:
-        sql_path = tmp_path / "db.sql"
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
-            actual = backup_database(db_config, sql_path, zip=True)
-        assert actual == tmp_path / "db.zip"
-        assert actual.exists()
-        assert not sql_path.exists()
+        sequential = self._backup(db_config, mock_db_conn, tmp_path / "seq.sql", jobs=1)
+        parallel = self._backup(db_config, mock_db_conn, tmp_path / "par.sql", jobs=3)
+        # Only the date line in the header may differ.
+        assert parallel.splitlines()[3:] == sequential.splitlines()[3:]
+        assert parallel.index("`a`") < parallel.index("`b`") < parallel.index("`d`")
 
-    def test_zip_contains_sql_member(
+    def test_removes_part_files(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
     ) -> None:
-        sql_path = tmp_path / "db.sql"
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
-            actual = backup_database(db_config, sql_path, zip=True)
-        with zipfile.ZipFile(actual) as zf:
-            assert zf.namelist() == ["db.sql"]
-            content = zf.read("db.sql").decode("utf-8")
-            assert "SET FOREIGN_KEY_CHECKS = 0;" in content
+        self._backup(db_config, mock_db_conn, tmp_path / "dump.sql", jobs=2)
+        assert [p.name for p in tmp_path.iterdir()] == ["dump.sql"]
 
-    def test_raises_if_zip_exists(
+    def test_workers_reuse_their_connection(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
     ) -> None:
-        sql_path = tmp_path / "db.sql"
-        (tmp_path / "db.zip").write_text("existing")
-
         with (
-            pytest.raises(BackupError, match="already exists"),
-            patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn),
+            patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn) as mock_cls,
+            patch("sqlbackup.backup.ProcessPoolExecutor", ThreadPoolExecutor),
         ):
-            backup_database(db_config, sql_path, zip=True)
-        # Original .sql must not have been written either
-        assert not sql_path.exists()
+            backup_database(db_config, tmp_path / "dump.sql", jobs=2)
+        # The main connection plus at most one per worker, not one per table.
+        assert mock_cls.call_count <= 3
 
-    def test_zip_with_incremental(
+    def test_worker_error_propagates(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
     ) -> None:
-        base = tmp_path / "db.sql"
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
-            actual = backup_database(db_config, base, incremental=5, zip=True)
-        assert re.match(r"^\d{8}_\d{6}_db\.zip$", actual.name)
-        assert actual.exists()
-        assert not base.exists()
-        # No leftover unzipped intermediate
-        leftovers = list(tmp_path.glob("*_db.sql"))
-        assert leftovers == []
-
-    def test_zip_incremental_cleanup_only_zips(
+        mock_db_conn.get_create_table.side_effect = BackupError("boom")
+        with pytest.raises(BackupError, match="boom"):
+            self._backup(db_config, mock_db_conn, tmp_path / "dump.sql", jobs=2)
+        assert [p.name for p in tmp_path.iterdir()] == ["dump.sql"]
+
+    def test_few_tables_stay_sequential(
         self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
     ) -> None:
-        # Pre-existing .zip files; cleanup should rotate by .zip pattern
-        for i in range(5):
-            (tmp_path / f"2026010{i}_120000_db.zip").write_text("")
-        # Pre-existing unrelated .sql should not be deleted
-        (tmp_path / "20260101_120000_db.sql").write_text("")
-
-        base = tmp_path / "db.sql"
-        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
-            backup_database(db_config, base, incremental=3, zip=True)
-
-        zips = sorted(tmp_path.glob("*_db.zip"))
-        assert len(zips) == 3
-        # Untouched .sql remains
-        assert (tmp_path / "20260101_120000_db.sql").exists()
+        mock_db_conn.get_tables.return_value = ["a"]
+        with (
+            patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn),
+            patch("sqlbackup.backup.ProcessPoolExecutor") as mock_pool,
+        ):
+            backup_database(db_config, tmp_path / "dump.sql", jobs=4)
+        mock_pool.assert_not_called()
 
 
 class TestBackupFilters:
-    @pytest.fixture()
-    def db_config(self) -> DbConfig:
-        return DbConfig(
-            host="localhost", port=3306, user="root", password="secret", database="testdb"
-        )
-
     @pytest.fixture()
     def mock_db_conn(self) -> MagicMock:
         mock = MagicMock()
@@ -432,23 +377,3 @@ class TestBackupFilters:
         ):
             backup_database(db_config, output, includes=["users"], excludes=["logs"])
         assert not output.exists()
-
-
-class TestCleanupOldBackupsZipped:
-    def test_keeps_n_most_recent_zip(self, tmp_path: Path) -> None:
-        for i in range(5):
-            (tmp_path / f"2026010{i}_120000_db.zip").write_text("")
-        cleanup_old_backups(tmp_path / "db.sql", keep=2, zipped=True)
-        remaining = sorted(tmp_path.glob("*_db.zip"))
-        assert len(remaining) == 2
-        assert remaining[0].name == "20260103_120000_db.zip"
-
-    def test_zipped_does_not_touch_sql_files(self, tmp_path: Path) -> None:
-        for i in range(3):
-            (tmp_path / f"2026010{i}_120000_db.zip").write_text("")
-        (tmp_path / "20260101_120000_db.sql").write_text("")
-        cleanup_old_backups(tmp_path / "db.sql", keep=1, zipped=True)
-        assert (tmp_path / "20260101_120000_db.sql").exists()
-        zips = sorted(tmp_path.glob("*_db.zip"))
-        assert len(zips) == 1
-        assert zips[0].name == "20260102_120000_db.zip"
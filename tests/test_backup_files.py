@@ -0,0 +1,210 @@
+"""Tests for backup output files: incremental paths, rotation and compression."""
+
+from __future__ import annotations
+
+import gzip
+import re
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sqlbackup.backup import backup_database, cleanup_old_backups, resolve_incremental_path
+from sqlbackup.config import DbConfig
+from sqlbackup.exceptions import BackupError
+
+
+@pytest.fixture()
+def db_config() -> DbConfig:
+    return DbConfig(host="localhost", port=3306, user="root", password="secret", database="testdb")
+
+
+@pytest.fixture()
+def mock_db_conn() -> MagicMock:
+    """A connection to an empty database."""
+    mock = MagicMock()
+    mock.__enter__ = MagicMock(return_value=mock)
+    mock.__exit__ = MagicMock(return_value=False)
+    mock.get_tables.return_value = []
+    return mock
+
+
+class TestResolveIncrementalPath:
+    def test_prepends_timestamp(self, tmp_path: Path) -> None:
+        base = tmp_path / "db.sql"
+        result = resolve_incremental_path(base)
+        assert result.parent == tmp_path
+        assert re.match(r"^\d{8}_\d{6}_db\.sql$", result.name)
+
+    def test_preserves_directory(self, tmp_path: Path) -> None:
+        base = tmp_path / "sub" / "db.sql"
+        result = resolve_incremental_path(base)
+        assert result.parent == tmp_path / "sub"
+
+
+class TestCleanupOldBackups:
+    def test_keeps_n_most_recent(self, tmp_path: Path) -> None:
+        for i in range(5):
+            (tmp_path / f"2026010{i}_120000_db.sql").write_text("")
+        cleanup_old_backups(tmp_path / "db.sql", keep=3)
+        remaining = sorted(tmp_path.glob("*_db.sql"))
+        assert len(remaining) == 3
+        assert remaining[0].name == "20260102_120000_db.sql"
+
+    def test_no_delete_when_fewer_than_keep(self, tmp_path: Path) -> None:
+        for i in range(2):
+            (tmp_path / f"2026010{i}_120000_db.sql").write_text("")
+        cleanup_old_backups(tmp_path / "db.sql", keep=5)
+        remaining = list(tmp_path.glob("*_db.sql"))
+        assert len(remaining) == 2
+
+    def test_does_not_touch_unrelated_files(self, tmp_path: Path) -> None:
+        (tmp_path / "20260101_120000_db.sql").write_text("")
+        (tmp_path / "20260102_120000_other.sql").write_text("")
+        cleanup_old_backups(tmp_path / "db.sql", keep=1)
+        assert (tmp_path / "20260101_120000_db.sql").exists()
+        assert (tmp_path / "20260102_120000_other.sql").exists()
+
+
+class TestIncrementalBackup:
+    def test_creates_timestamped_file(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        base = tmp_path / "db.sql"
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            actual = backup_database(db_config, base, incremental=5)
+        assert re.match(r"^\d{8}_\d{6}_db\.sql$", actual.name)
+        assert actual.exists()
+
+    def test_does_not_error_when_base_exists(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        base = tmp_path / "db.sql"
+        base.write_text("existing")
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            actual = backup_database(db_config, base, incremental=5)
+        assert actual.exists()
+        assert actual != base
+
+    def test_cleanup_runs_after_backup(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        for i in range(5):
+            (tmp_path / f"2026010{i}_120000_db.sql").write_text("")
+        base = tmp_path / "db.sql"
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            backup_database(db_config, base, incremental=3)
+        remaining = list(tmp_path.glob("*_db.sql"))
+        assert len(remaining) == 3
+
+
+class TestZipBackup:
+    def test_creates_zip_and_removes_sql(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        sql_path = tmp_path / "db.sql"
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            actual = backup_database(db_config, sql_path, zip=True)
+        assert actual == tmp_path / "db.zip"
+        assert actual.exists()
+        assert not sql_path.exists()
+
+    def test_zip_contains_sql_member(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        sql_path = tmp_path / "db.sql"
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            actual = backup_database(db_config, sql_path, zip=True)
+        with zipfile.ZipFile(actual) as zf:
+            assert zf.namelist() == ["db.sql"]
+            content = zf.read("db.sql").decode("utf-8")
+            assert "SET FOREIGN_KEY_CHECKS = 0;" in content
+
+    def test_raises_if_zip_exists(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        sql_path = tmp_path / "db.sql"
+        (tmp_path / "db.zip").write_text("existing")
+
+        with (
+            pytest.raises(BackupError, match="already exists"),
+            patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn),
+        ):
+            backup_database(db_config, sql_path, zip=True)
+        # Original .sql must not have been written either
+        assert not sql_path.exists()
+
+    def test_zip_with_incremental(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        base = tmp_path / "db.sql"
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            actual = backup_database(db_config, base, incremental=5, zip=True)
+        assert re.match(r"^\d{8}_\d{6}_db\.zip$", actual.name)
+        assert actual.exists()
+        assert not base.exists()
+        # No leftover unzipped intermediate
+        leftovers = list(tmp_path.glob("*_db.sql"))
+        assert leftovers == []
+
+    def test_zip_incremental_cleanup_only_zips(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        # Pre-existing .zip files; cleanup should rotate by .zip pattern
+        for i in range(5):
+            (tmp_path / f"2026010{i}_120000_db.zip").write_text("")
+        # Pre-existing unrelated .sql should not be deleted
+        (tmp_path / "20260101_120000_db.sql").write_text("")
+
+        base = tmp_path / "db.sql"
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            backup_database(db_config, base, incremental=3, zip=True)
+
+        zips = sorted(tmp_path.glob("*_db.zip"))
+        assert len(zips) == 3
+        # Untouched .sql remains
+        assert (tmp_path / "20260101_120000_db.sql").exists()
+
+
+class TestGzipBackup:
+    def test_gz_path_writes_gzip(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        gz_path = tmp_path / "db.sql.gz"
+        with patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn):
+            actual = backup_database(db_config, gz_path)
+        assert actual == gz_path
+        with gzip.open(gz_path, "rt", encoding="utf-8") as f:
+            assert "SET FOREIGN_KEY_CHECKS = 0;" in f.read()
+
+    def test_gz_path_with_zip_raises(
+        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    ) -> None:
+        gz_path = tmp_path / "db.sql.gz"
+        with (
+            pytest.raises(BackupError, match="cannot be combined"),
+            patch("sqlbackup.backup.DatabaseConnection", return_value=mock_db_conn),
+        ):
+            backup_database(db_config, gz_path, zip=True)
+        assert not gz_path.exists()
+
+
+class TestCleanupOldBackupsZipped:
+    def test_keeps_n_most_recent_zip(self, tmp_path: Path) -> None:
+        for i in range(5):
+            (tmp_path / f"2026010{i}_120000_db.zip").write_text("")
+        cleanup_old_backups(tmp_path / "db.sql", keep=2, zipped=True)
+        remaining = sorted(tmp_path.glob("*_db.zip"))
+        assert len(remaining) == 2
+        assert remaining[0].name == "20260103_120000_db.zip"
+
+    def test_zipped_does_not_touch_sql_files(self, tmp_path: Path) -> None:
+        for i in range(3):
+            (tmp_path / f"2026010{i}_120000_db.zip").write_text("")
+        (tmp_path / "20260101_120000_db.sql").write_text("")
+        cleanup_old_backups(tmp_path / "db.sql", keep=1, zipped=True)
+        assert (tmp_path / "20260101_120000_db.sql").exists()
+        zips = sorted(tmp_path.glob("*_db.zip"))
+        assert len(zips) == 1
+        assert zips[0].name == "20260102_120000_db.zip"
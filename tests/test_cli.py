@@ -27,7 +27,13 @@ class TestCLI:
 
         mock_load.assert_called_once_with("mydb")
         mock_backup.assert_called_once_with(
-            config, output, incremental=None, zip=False, includes=None, excludes=None
+            config,
+            output,
+            incremental=None,
+            zip=False,
+            includes=None,
+            excludes=None,
+            jobs=1,
         )
 
     def test_push_dispatches(self, tmp_path: Path) -> None:
@@ -163,7 +169,13 @@ class TestCLI:
             main()
 
         mock_backup.assert_called_once_with(
-            config, output, incremental=5, zip=False, includes=None, excludes=None
+            config,
+            output,
+            incremental=5,
+            zip=False,
+            includes=None,
+            excludes=None,
+            jobs=1,
         )
 
     def test_zip_passes_to_backup(self, tmp_path: Path) -> None:
@@ -189,7 +201,13 @@ class TestCLI:
             main()
 
         mock_backup.assert_called_once_with(
-            config, output, incremental=None, zip=True, includes=None, excludes=None
+            config,
+            output,
+            incremental=None,
+            zip=True,
+            includes=None,
+            excludes=None,
+            jobs=1,
         )
 
     def test_zip_with_push_rejected(self, tmp_path: Path) -> None:
@@ -213,6 +231,35 @@ class TestCLI:
 
         assert exc_info.value.code == 2
 
+    def test_jobs_passes_to_backup(self, tmp_path: Path) -> None:
+        output = tmp_path / "dump.sql"
+        argv = ["--backup", "--config", "mydb", "--path", str(output), "--jobs", "4"]
+
+        with (
+            patch("sqlbackup.cli.load_config"),
+            patch("sqlbackup.cli.backup_database", return_value=output) as mock_backup,
+            patch("sys.argv", ["sqlbackup", *argv]),
+        ):
+            main()
+
+        assert mock_backup.call_args.kwargs["jobs"] == 4
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--push", "--config", "mydb", "--path", "dump.sql", "--jobs", "4"],
+            ["--backup", "--config", "mydb", "--path", "dump.sql", "--jobs", "0"],
+        ],
+    )
+    def test_invalid_jobs_rejected(self, argv: list[str]) -> None:
+        with (
+            patch("sys.argv", ["sqlbackup", *argv]),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 2
+
     def test_include_tables_passes_to_backup(self, tmp_path: Path) -> None:
         config = MagicMock()
         output = tmp_path / "dump.sql"
@@ -245,6 +292,7 @@ class TestCLI:
             zip=False,
             includes=["users", "posts"],
             excludes=None,
+            jobs=1,
         )
 
     def test_exclude_tables_passes_to_backup(self, tmp_path: Path) -> None:
@@ -277,6 +325,7 @@ class TestCLI:
             zip=False,
             includes=None,
             excludes=["logs"],
+            jobs=1,
         )
 
     def test_include_and_exclude_rejected(self, tmp_path: Path) -> None:
@@ -366,97 +415,3 @@ class TestCLI:
             main()
 
         assert exc_info.value.code == 2
-
-
-class TestCopyCLI:
-    def test_copy_dispatches(self) -> None:
-        src = MagicMock()
-        tgt = MagicMock()
-
-        def load(name: str) -> MagicMock:
-            return src if name == "prod" else tgt
-
-        with (
-            patch("sqlbackup.cli.load_config", side_effect=load) as mock_load,
-            patch("sqlbackup.cli.copy_database") as mock_copy,
-            patch(
-                "sys.argv",
-                ["sqlbackup", "--copy", "--source", "prod", "--target", "test"],
-            ),
-        ):
-            main()
-
-        assert mock_load.call_count == 2
-        mock_copy.assert_called_once_with(
-            src, tgt, includes=None, excludes=None, force=False
-        )
-
-    def test_copy_missing_source_exits(self) -> None:
-        with (
-            patch("sys.argv", ["sqlbackup", "--copy", "--target", "test"]),
-            pytest.raises(SystemExit) as exc_info,
-        ):
-            main()
-
-        assert exc_info.value.code == 2
-
-    def test_copy_missing_target_exits(self) -> None:
-        with (
-            patch("sys.argv", ["sqlbackup", "--copy", "--source", "prod"]),
-            pytest.raises(SystemExit) as exc_info,
-        ):
-            main()
-
-        assert exc_info.value.code == 2
-
-    def test_copy_rejects_config_or_path(self) -> None:
-        with (
-            patch(
-                "sys.argv",
-                [
-                    "sqlbackup",
-                    "--copy",
-                    "--source",
-                    "prod",
-                    "--target",
-                    "test",
-                    "--config",
-                    "x",
-                ],
-            ),
-            pytest.raises(SystemExit) as exc_info,
-        ):
-            main()
-
-        assert exc_info.value.code == 2
-
-    def test_copy_passes_filters_and_force(self) -> None:
-        src = MagicMock()
-        tgt = MagicMock()
-
-        def load(name: str) -> MagicMock:
-            return src if name == "prod" else tgt
-
-        with (
-            patch("sqlbackup.cli.load_config", side_effect=load),
-            patch("sqlbackup.cli.copy_database") as mock_copy,
-            patch(
-                "sys.argv",
-                [
-                    "sqlbackup",
-                    "--copy",
-                    "--source",
-                    "prod",
-                    "--target",
-                    "test",
-                    "--exclude-table",
-                    "logs",
-                    "--force",
-                ],
-            ),
-        ):
-            main()
-
-        mock_copy.assert_called_once_with(
-            src, tgt, includes=None, excludes=["logs"], force=True
-        )
@@ -0,0 +1,99 @@
+"""Tests for the --copy mode of the CLI."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sqlbackup.cli import main
+
+
+class TestCopyCLI:
+    def test_copy_dispatches(self) -> None:
+        src = MagicMock()
+        tgt = MagicMock()
+
+        def load(name: str) -> MagicMock:
+            return src if name == "prod" else tgt
+
+        with (
+            patch("sqlbackup.cli.load_config", side_effect=load) as mock_load,
+            patch("sqlbackup.cli.copy_database") as mock_copy,
+            patch(
+                "sys.argv",
+                ["sqlbackup", "--copy", "--source", "prod", "--target", "test"],
+            ),
+        ):
+            main()
+
+        assert mock_load.call_count == 2
+        mock_copy.assert_called_once_with(src, tgt, includes=None, excludes=None, force=False)
+
+    def test_copy_missing_source_exits(self) -> None:
+        with (
+            patch("sys.argv", ["sqlbackup", "--copy", "--target", "test"]),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 2
+
+    def test_copy_missing_target_exits(self) -> None:
+        with (
+            patch("sys.argv", ["sqlbackup", "--copy", "--source", "prod"]),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 2
+
+    def test_copy_rejects_config_or_path(self) -> None:
+        with (
+            patch(
+                "sys.argv",
+                [
+                    "sqlbackup",
+                    "--copy",
+                    "--source",
+                    "prod",
+                    "--target",
+                    "test",
+                    "--config",
+                    "x",
+                ],
+            ),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 2
+
+    def test_copy_passes_filters_and_force(self) -> None:
+        src = MagicMock()
+        tgt = MagicMock()
+
+        def load(name: str) -> MagicMock:
+            return src if name == "prod" else tgt
+
+        with (
+            patch("sqlbackup.cli.load_config", side_effect=load),
+            patch("sqlbackup.cli.copy_database") as mock_copy,
+            patch(
+                "sys.argv",
+                [
+                    "sqlbackup",
+                    "--copy",
+                    "--source",
+                    "prod",
+                    "--target",
+                    "test",
+                    "--exclude-table",
+                    "logs",
+                    "--force",
+                ],
+            ),
+        ):
+            main()
+
+        mock_copy.assert_called_once_with(src, tgt, includes=None, excludes=["logs"], force=True)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
+from pymysql.constants import CLIENT
 
 from sqlbackup.config import DbConfig
 from sqlbackup.connection import DatabaseConnection
@@ -37,8 +38,39 @@ class TestDatabaseConnection:
                 read_timeout=600,
                 write_timeout=600,
                 max_allowed_packet=64 * 1024 * 1024,
+                init_command="SET SESSION net_read_timeout = 600, net_write_timeout = 600",
+                client_flag=0,
             )
 
+    def test_multi_statements_sets_client_flag(
+        self, db_config: DbConfig, mock_pymysql: MagicMock
+    ) -> None:
+        with DatabaseConnection(db_config, multi_statements=True):
+            kwargs = mock_pymysql.connect.call_args.kwargs
+        assert kwargs["client_flag"] == CLIENT.MULTI_STATEMENTS
+
+    def test_snapshot_starts_consistent_transaction(
+        self, db_config: DbConfig, mock_pymysql: MagicMock
+    ) -> None:
+        mock_conn = mock_pymysql.connect.return_value
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        with DatabaseConnection(db_config, snapshot=True):
+            pass
+
+        assert mock_cursor.execute.call_args_list == [
+            call("SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ"),
+            call("START TRANSACTION WITH CONSISTENT SNAPSHOT"),
+        ]
+
+    def test_no_snapshot_by_default(self, db_config: DbConfig, mock_pymysql: MagicMock) -> None:
+        mock_conn = mock_pymysql.connect.return_value
+        with DatabaseConnection(db_config):
+            pass
+        mock_conn.cursor.assert_not_called()
+
     def test_closes_on_exit(self, db_config: DbConfig, mock_pymysql: MagicMock) -> None:
         mock_conn = mock_pymysql.connect.return_value
         with DatabaseConnection(db_config):
@@ -92,6 +124,34 @@ class TestDatabaseConnection:
         assert cols == ["id", "name", "email"]
         mock_cursor.execute.assert_called_once_with("SELECT * FROM `users` LIMIT 0")
 
+    def test_get_column_type_codes(self, db_config: DbConfig, mock_pymysql: MagicMock) -> None:
+        mock_conn = mock_pymysql.connect.return_value
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        mock_cursor.description = [("id", 3), ("name", 253)]
+
+        with DatabaseConnection(db_config) as db:
+            codes = db.get_column_type_codes("users")
+
+        assert codes == [3, 253]
+        mock_cursor.execute.assert_called_once_with("SELECT * FROM `users` LIMIT 0")
+
+    def test_column_names_and_types_share_one_query(
+        self, db_config: DbConfig, mock_pymysql: MagicMock
+    ) -> None:
+        mock_conn = mock_pymysql.connect.return_value
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        mock_cursor.description = [("id", 3), ("name", 253)]
+
+        with DatabaseConnection(db_config) as db:
+            assert db.get_column_names("users") == ["id", "name"]
+            assert db.get_column_type_codes("users") == [3, 253]
+
+        mock_cursor.execute.assert_called_once_with("SELECT * FROM `users` LIMIT 0")
+
     def test_iter_rows(self, db_config: DbConfig, mock_pymysql: MagicMock) -> None:
         mock_conn = mock_pymysql.connect.return_value
         mock_ss_cursor = MagicMock()
@@ -120,3 +180,50 @@ class TestDatabaseConnection:
 
         mock_cursor.execute.assert_called_once_with("DROP TABLE IF EXISTS `users`")
         mock_conn.commit.assert_called()
+
+    def test_execute_many_commits_in_batches(
+        self, db_config: DbConfig, mock_pymysql: MagicMock
+    ) -> None:
+        mock_conn = mock_pymysql.connect.return_value
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        with DatabaseConnection(db_config) as db:
+            db.execute_many((f"INSERT INTO `t` VALUES ({i})" for i in range(5)), commit_every=2)
+
+        assert mock_cursor.execute.call_count == 5
+        mock_cursor.execute.assert_called_with("INSERT INTO `t` VALUES (4)")
+        # Two commits for the full batches, one for the remainder.
+        assert mock_conn.commit.call_count == 3
+        mock_conn.cursor.assert_called_once()
+
+    def test_execute_many_reads_every_result_set(
+        self, db_config: DbConfig, mock_pymysql: MagicMock
+    ) -> None:
+        mock_conn = mock_pymysql.connect.return_value
+        mock_cursor = MagicMock()
+        mock_cursor.nextset.side_effect = [True, None]
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        with DatabaseConnection(db_config, multi_statements=True) as db:
+            db.execute_many(["INSERT INTO `t` VALUES (1);\nINSERT INTO `t` VALUES (2)"])
+
+        assert mock_cursor.nextset.call_count == 2
+
+    def test_execute_many_commits_each_grouped_query(
+        self, db_config: DbConfig, mock_pymysql: MagicMock
+    ) -> None:
+        mock_conn = mock_pymysql.connect.return_value
+        mock_cursor = MagicMock()
+        mock_cursor.nextset.return_value = None
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        groups = ["INSERT INTO `t` VALUES (1);\nINSERT INTO `t` VALUES (2)"] * 3
+
+        with DatabaseConnection(db_config, multi_statements=True) as db:
+            db.execute_many(groups, commit_every=1)
+
+        # One commit per group, plus the final one.
+        assert mock_conn.commit.call_count == 4
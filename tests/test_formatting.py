@@ -0,0 +1,68 @@
+"""Tests for formatting module."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from pymysql.constants import FIELD_TYPE
+
+from sqlbackup.formatting import column_formatters, format_rows, format_value
+
+
+class TestFormatValue:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, "NULL"),
+            (True, "1"),
+            (False, "0"),
+            (42, "42"),
+            (1.5, "1.5"),
+            (b"\xab", "X'ab'"),
+            ("it's", "'it\\'s'"),
+            (Decimal("9.90"), "'9.90'"),
+            (datetime(2026, 2, 13, 14, 30), "'2026-02-13 14:30:00'"),
+        ],
+    )
+    def test_formats_literal(self, value: object, expected: str) -> None:
+        assert format_value(value) == expected
+
+
+class TestFormatRows:
+    def test_formats_columns_by_type(self) -> None:
+        formatters = column_formatters([FIELD_TYPE.LONG, FIELD_TYPE.DOUBLE, FIELD_TYPE.BIT])
+        rows = [(1, 0.5, b"\x01"), (None, None, None), (3, 1e-07, b"\xff")]
+
+        assert format_rows(rows, formatters) == [
+            "(1, 0.5, X'01')",
+            "(NULL, NULL, NULL)",
+            "(3, 1e-07, X'ff')",
+        ]
+
+    def test_formats_numeric_batches(self) -> None:
+        formatters = column_formatters([FIELD_TYPE.LONGLONG, FIELD_TYPE.DOUBLE])
+
+        assert format_rows([(1, 0.1), (-2, 3.0)], formatters) == ["(1, 0.1)", "(-2, 3.0)"]
+        assert format_rows([(3, None)], formatters) == ["(3, NULL)"]
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("C:\\temp\\it's", "(1, 'C:\\\\temp\\\\it\\'s')"),
+            ("Zoë 東京", "(1, 'Zoë 東京')"),
+            (b"\x00\x01", "(1, X'0001')"),
+            (None, "(1, NULL)"),
+        ],
+    )
+    def test_formats_text_columns(self, value: object, expected: str) -> None:
+        formatters = column_formatters([FIELD_TYPE.LONG, FIELD_TYPE.BLOB])
+
+        assert format_rows([(1, value)], formatters) == [expected]
+
+    def test_unknown_types_fall_back_to_format_value(self) -> None:
+        formatters = column_formatters([FIELD_TYPE.NEWDECIMAL, FIELD_TYPE.DATETIME])
+        row = (Decimal("9.90"), datetime(2026, 2, 13, 14, 30))
+
+        assert format_rows([row], formatters) == ["('9.90', '2026-02-13 14:30:00')"]
@@ -2,233 +2,388 @@
 
 from __future__ import annotations
 
+import gzip
+import io
 import zipfile
+from collections.abc import Iterable
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from sqlbackup.config import DbConfig
+from sqlbackup.constants import DEFAULT_COMMIT_EVERY
 from sqlbackup.exceptions import PushError
 from sqlbackup.push import push_database
 
+# Reused SQL payloads, kept as the bytes push_database reads.
+_DUMP_BASIC = (
+    b"SET FOREIGN_KEY_CHECKS = 0;\n"
+    b"DROP TABLE IF EXISTS `users`;\n"
+    b"CREATE TABLE `users` (id INT);\n"
+    b"SET FOREIGN_KEY_CHECKS = 1;\n"
+)
+_DUMP_USERS = b"DROP TABLE IF EXISTS `users`;\nCREATE TABLE `users` (id INT);\n"
+_DROP_USERS = b"DROP TABLE IF EXISTS `users`;\n"
+_DB_CONFIG = DbConfig(
+    host="localhost", port=3306, user="root", password="secret", database="testdb"
+)
+
+
+class RecordingConn:
+    """Stand-in for DatabaseConnection that records every executed statement."""
+
+    def __init__(self) -> None:
+        self.tables: list[str] = []
+        self.calls: list[str] = []
+        self.opened: list[dict[str, object]] = []
+        self.commit_every: list[int] = []
+
+    def reset(self) -> None:
+        """Forget everything recorded by the previous test."""
+        # Default to empty target so the non-empty-guard does not trigger.
+        self.tables.clear()
+        self.calls.clear()
+        self.opened.clear()
+        self.commit_every.clear()
+
+    def open(self, config: DbConfig, **kwargs: object) -> RecordingConn:
+        """Replacement for the DatabaseConnection class; records its options."""
+        self.opened.append(kwargs)
+        return self
+
+    def __enter__(self) -> RecordingConn:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+    def get_tables(self) -> list[str]:
+        return self.tables
+
+    def execute_sql(self, sql: str) -> None:
+        self.calls.append(sql)
+
+    def execute_many(
+        self, statements: Iterable[str], commit_every: int = DEFAULT_COMMIT_EVERY
+    ) -> None:
+        self.commit_every.append(commit_every)
+        self.calls.extend(statements)
+
 
-@pytest.fixture()
-def db_config() -> DbConfig:
-    return DbConfig(host="localhost", port=3306, user="root", password="secret", database="testdb")
+@pytest.fixture(scope="class")
+def db_conn() -> RecordingConn:
+    return RecordingConn()
 
 
-@pytest.fixture()
-def mock_db_conn() -> MagicMock:
-    mock = MagicMock()
-    mock.__enter__ = MagicMock(return_value=mock)
-    mock.__exit__ = MagicMock(return_value=False)
-    # Default to empty target so the non-empty-guard does not trigger.
-    mock.get_tables.return_value = []
-    return mock
+@pytest.fixture(autouse=True)
+def patched_conn(monkeypatch: pytest.MonkeyPatch, db_conn: RecordingConn) -> None:
+    db_conn.reset()
+    monkeypatch.setattr("sqlbackup.push.DatabaseConnection", db_conn.open)
 
 
 class TestPushDatabase:
-    def test_file_not_found_raises(self, db_config: DbConfig, tmp_path: Path) -> None:
+    def test_file_not_found_raises(self, tmp_path: Path) -> None:
         missing = tmp_path / "missing.sql"
         with pytest.raises(PushError, match="SQL file not found"):
-            push_database(db_config, missing)
-
-    def test_executes_statements(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+            push_database(_DB_CONFIG, missing)
+
+    def test_executes_statements(self, db_conn: RecordingConn) -> None:
+        sql_file = io.BytesIO(_DUMP_BASIC)
+
+        push_database(_DB_CONFIG, sql_file)
+
+        expected = {
+            "SET GLOBAL max_allowed_packet = 67108864",
+            "SET FOREIGN_KEY_CHECKS = 0",
+            "DROP TABLE IF EXISTS `users`",
+            "CREATE TABLE `users` (id INT)",
+            "SET FOREIGN_KEY_CHECKS = 1",
+        }
+        assert expected <= set(db_conn.calls)
+
+    def test_leaves_stream_open(self, db_conn: RecordingConn) -> None:
+        sql_file = io.BytesIO(b"SELECT 1;\n")
+
+        push_database(_DB_CONFIG, sql_file)
+
+        assert db_conn.calls[1:] == ["SELECT 1"]
+        assert not sql_file.closed
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            pytest.param(
+                b"-- This is a comment\n\nDROP TABLE IF EXISTS `users`;\n\n-- Another comment\n",
+                ["DROP TABLE IF EXISTS `users`"],
+                id="comments-and-blank-lines",
+            ),
+            pytest.param(
+                b"# disable checks; then load\nSELECT 1;\nSELECT '#1', `a#b`; # trailing\n",
+                ["SELECT 1", "SELECT '#1', `a#b`"],
+                id="hash-line-comments",
+            ),
+            pytest.param(
+                b"INSERT INTO `users` (`id`, `name`) VALUES\n(1, 'alice'),\n(2, 'bob');\n",
+                ["INSERT INTO `users` (`id`, `name`) VALUES\n(1, 'alice'),\n(2, 'bob')"],
+                id="multiline-insert",
+            ),
+            pytest.param(
+                b"CREATE TABLE `users` (\n"
+                b"  `id` int NOT NULL,\n"
+                b"  PRIMARY KEY (`id`)\n"
+                b") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n",
+                [
+                    "CREATE TABLE `users` (\n"
+                    "  `id` int NOT NULL,\n"
+                    "  PRIMARY KEY (`id`)\n"
+                    ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+                ],
+                id="multiline-create-table",
+            ),
+            pytest.param(
+                b"INSERT INTO `wp_options` (`option_name`, `option_value`) VALUES\n"
+                b"('wptouch_settings', 's:10:\"site_title\";\n"
+                b's:7:"#ffffff";\');\n',
+                [
+                    "INSERT INTO `wp_options` (`option_name`, `option_value`) VALUES\n"
+                    "('wptouch_settings', 's:10:\"site_title\";\n"
+                    's:7:"#ffffff";\')'
+                ],
+                id="semicolons-in-string-values",
+            ),
+            pytest.param(
+                b"SET @a = 1; SET @b = 2; -- trailing comment\n",
+                ["SET @a = 1", "SET @b = 2"],
+                id="statements-sharing-a-line",
+            ),
+            pytest.param(
+                b"INSERT INTO `t` VALUES (1, 2);\n"
+                b"INSERT INTO `t` VALUES ('a;b', 'it\\'s');\n"
+                b"SELECT 1--2;\n"
+                b"SELECT 3",
+                [
+                    "INSERT INTO `t` VALUES (1, 2),('a;b', 'it\\'s')",
+                    "SELECT 1--2",
+                    "SELECT 3",
+                ],
+                id="plain-and-quoted-statements",
+            ),
+            pytest.param(
+                b'INSERT INTO `odd;name` VALUES ("a;b");\nSELECT 1;\n',
+                ['INSERT INTO `odd;name` VALUES ("a;b")', "SELECT 1"],
+                id="double-quotes-and-backticks",
+            ),
+            pytest.param(
+                b"SELECT 'a', `b;c`;\nSELECT 'it''s; fine';\n",
+                ["SELECT 'a', `b;c`", "SELECT 'it''s; fine'"],
+                id="backticks-after-quotes-and-doubled-quotes",
+            ),
+            pytest.param(
+                b"/* header; with a semicolon */\n"
+                b"/*!40101 SET NAMES utf8mb4 */;\n"
+                b"/*M!100616 SET NOTE_VERBOSITY=0 */;\n"
+                b"CREATE TABLE `t` (a INT) /*M!100400 WITH SYSTEM VERSIONING; */;\n"
+                b"SELECT/* inline */1;\n",
+                [
+                    "/*!40101 SET NAMES utf8mb4 */",
+                    "/*M!100616 SET NOTE_VERBOSITY=0 */",
+                    "CREATE TABLE `t` (a INT) /*M!100400 WITH SYSTEM VERSIONING; */",
+                    "SELECT 1",
+                ],
+                id="block-and-executable-comments",
+            ),
+            pytest.param(
+                b"INSERT INTO `notes` VALUES (1, 'first line\n  -- not a comment;\n');\n",
+                ["INSERT INTO `notes` VALUES (1, 'first line\n  -- not a comment;\n')"],
+                id="whitespace-inside-string-values",
+            ),
+        ],
+    )
+    def test_splits_statements(
+        self, db_conn: RecordingConn, sql: bytes, expected: list[str]
     ) -> None:
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text(
-            "SET FOREIGN_KEY_CHECKS = 0;\n"
-            "DROP TABLE IF EXISTS `users`;\n"
-            "CREATE TABLE `users` (id INT);\n"
-            "SET FOREIGN_KEY_CHECKS = 1;\n",
-            encoding="utf-8",
-        )
-
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, sql_file)
+        push_database(_DB_CONFIG, io.BytesIO(sql))
 
-        calls = mock_db_conn.execute_sql.call_args_list
-        assert call("SET GLOBAL max_allowed_packet = 67108864") in calls
-        assert call("SET SESSION net_read_timeout = 600") in calls
-        assert call("SET SESSION net_write_timeout = 600") in calls
-        assert call("SET FOREIGN_KEY_CHECKS = 0") in calls
-        assert call("DROP TABLE IF EXISTS `users`") in calls
-        assert call("CREATE TABLE `users` (id INT)") in calls
-        assert call("SET FOREIGN_KEY_CHECKS = 1") in calls
+        # The first call is the SET GLOBAL max_allowed_packet.
+        assert db_conn.calls[1:] == expected
 
-    def test_skips_empty_lines_and_comments(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    def test_statements_span_read_chunks(
+        self, db_conn: RecordingConn, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text(
-            "-- This is a comment\n\nDROP TABLE IF EXISTS `users`;\n\n-- Another comment\n",
-            encoding="utf-8",
+        monkeypatch.setattr("sqlbackup.push.READ_CHUNK_SIZE", 3)
+        sql_file = io.BytesIO(
+            b"-- comment\nINSERT INTO `t` VALUES ('a;b', 1);\n/* c */\nSELECT 2;\n"
         )
 
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, sql_file)
+        push_database(_DB_CONFIG, sql_file)
 
-        calls = mock_db_conn.execute_sql.call_args_list
-        assert len(calls) == 4
-        assert calls[3] == call("DROP TABLE IF EXISTS `users`")
+        assert db_conn.calls[1:] == ["INSERT INTO `t` VALUES ('a;b', 1)", "SELECT 2"]
 
-    def test_handles_multiline_statements(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+    def test_long_statement_is_not_rescanned_per_chunk(
+        self, db_conn: RecordingConn, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text(
-            "INSERT INTO `users` (`id`, `name`) VALUES\n(1, 'alice'),\n(2, 'bob');\n",
-            encoding="utf-8",
-        )
+        monkeypatch.setattr("sqlbackup.push.READ_CHUNK_SIZE", 16)
+        rows = ",".join(f"({i}, 'it\\'s; row')" for i in range(1000))
+        sql_file = io.BytesIO(f"INSERT INTO `t` VALUES {rows};\nSELECT 2;\n".encode())
+        reads: list[int] = []
+        read = sql_file.read
 
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, sql_file)
+        def counting_read(size: int = -1) -> bytes:
+            reads.append(size)
+            return read(size)
 
-        calls = mock_db_conn.execute_sql.call_args_list
-        assert len(calls) == 4
-        assert "INSERT INTO `users`" in calls[3][0][0]
-        assert "(1, 'alice')" in calls[3][0][0]
-        assert "(2, 'bob')" in calls[3][0][0]
+        monkeypatch.setattr(sql_file, "read", counting_read)
 
-    def test_handles_create_table_multiline(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+        push_database(_DB_CONFIG, sql_file)
+
+        assert db_conn.calls[1:] == [f"INSERT INTO `t` VALUES {rows}", "SELECT 2"]
+        # Reads grow with the pending statement instead of staying at 16 bytes.
+        assert len(reads) < 20
+
+    def test_groups_consecutive_inserts(
+        self, db_conn: RecordingConn, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text(
-            "CREATE TABLE `users` (\n"
-            "  `id` int NOT NULL,\n"
-            "  `name` varchar(50) DEFAULT NULL,\n"
-            "  PRIMARY KEY (`id`)\n"
-            ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n",
-            encoding="utf-8",
+        monkeypatch.setattr("sqlbackup.push.INSERT_GROUP_SIZE", 2)
+        sql_file = io.BytesIO(
+            b"INSERT INTO `t` VALUES (1);\n"
+            b"insert into `t` VALUES (2);\n"
+            b"INSERT\nINTO `t` VALUES (3);\n"
+            b"DROP TABLE IF EXISTS `u`;\n"
+            b"INSERT INTO `u` VALUES (4);\n"
         )
 
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, sql_file)
-
-        calls = mock_db_conn.execute_sql.call_args_list
-        assert len(calls) == 4
-        assert "CREATE TABLE `users`" in calls[3][0][0]
-        assert "ENGINE=InnoDB" in calls[3][0][0]
+        push_database(_DB_CONFIG, sql_file)
+
+        assert {"multi_statements": True} in db_conn.opened
+        assert db_conn.calls[1:] == [
+            "INSERT INTO `t` VALUES (1);\ninsert into `t` VALUES (2)",
+            "INSERT\nINTO `t` VALUES (3)",
+            "DROP TABLE IF EXISTS `u`",
+            "INSERT INTO `u` VALUES (4)",
+        ]
+        # Each group is its own transaction.
+        assert db_conn.commit_every == [1]
+
+    def test_merges_inserts_into_the_same_table(self, db_conn: RecordingConn) -> None:
+        sql_file = io.BytesIO(
+            b"INSERT INTO `t` (`a`, `b`) VALUES (1, 'x;y');\n"
+            b"INSERT INTO `t` (`a`, `b`) VALUES (2, X'ab'),(-3.5e2, _utf8mb4 'it''s');\n"
+            b"INSERT INTO `u` VALUES (4);\n"
+            b"INSERT INTO `u` VALUES (5) ON DUPLICATE KEY UPDATE `a` = VALUES(`a`);\n"
+            b"DROP TABLE IF EXISTS `v`;\n"
+            b"INSERT INTO `t` (`a`, `b`) VALUES (6, '');\n"
+        )
 
-    def test_handles_semicolons_in_string_values(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
+        push_database(_DB_CONFIG, sql_file)
+
+        assert db_conn.calls[1:] == [
+            "INSERT INTO `t` (`a`, `b`) VALUES (1, 'x;y'),(2, X'ab'),(-3.5e2, _utf8mb4 'it''s');\n"
+            "INSERT INTO `u` VALUES (4);\n"
+            "INSERT INTO `u` VALUES (5) ON DUPLICATE KEY UPDATE `a` = VALUES(`a`)",
+            "DROP TABLE IF EXISTS `v`",
+            "INSERT INTO `t` (`a`, `b`) VALUES (6, '')",
+        ]
+
+    @pytest.mark.parametrize(
+        "value",
+        ["LAST_INSERT_ID()", "(SELECT MAX(`id`) FROM `u`)", "UNHEX('ab')", "1 + 1", "`a`"],
+    )
+    def test_does_not_merge_expressions(self, db_conn: RecordingConn, value: str) -> None:
+        statements = [
+            "INSERT INTO `t` VALUES (NULL, 'a')",
+            f"INSERT INTO `t` VALUES (NULL, {value})",
+        ]
+        sql_file = io.BytesIO(";\n".join(statements).encode())
+
+        push_database(_DB_CONFIG, sql_file)
+
+        assert db_conn.calls[1:] == [";\n".join(statements)]
+
+    def test_merged_inserts_respect_byte_cap(
+        self, db_conn: RecordingConn, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Semicolons inside string literals must not split the statement."""
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text(
-            "INSERT INTO `wp_options` (`option_name`, `option_value`) VALUES\n"
-            "('wptouch_settings', 's:10:\"site_title\";\n"
-            "s:29:\"XIDA Design & Tech\";\n"
-            "s:5:\"color\";\n"
-            "s:7:\"#ffffff\";');\n",
-            encoding="utf-8",
-        )
+        monkeypatch.setattr("sqlbackup.push.INSERT_GROUP_BYTES", 32)
+        monkeypatch.setattr("sqlbackup.push.INSERT_GROUP_SIZE", 1)
+        sql_file = io.BytesIO(b"INSERT INTO `t` VALUES (1);\n" * 3)
 
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, sql_file)
+        push_database(_DB_CONFIG, sql_file)
 
-        calls = mock_db_conn.execute_sql.call_args_list
-        # 1 SET GLOBAL + 2 session SETs + 1 INSERT = 4
-        assert len(calls) == 4
-        stmt = calls[3][0][0]
-        assert "INSERT INTO `wp_options`" in stmt
-        assert "s:10:\"site_title\";" in stmt
-        assert "s:7:\"#ffffff\";" in stmt
+        assert db_conn.calls[1:] == ["INSERT INTO `t` VALUES (1),(1)", "INSERT INTO `t` VALUES (1)"]
 
 
 class TestPushZip:
-    def test_extracts_and_pushes_from_zip(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
-        sql_content = "DROP TABLE IF EXISTS `users`;\nCREATE TABLE `users` (id INT);\n"
+    def test_extracts_and_pushes_from_zip(self, db_conn: RecordingConn, tmp_path: Path) -> None:
         zip_path = tmp_path / "dump.zip"
         with zipfile.ZipFile(zip_path, "w") as zf:
-            zf.writestr("dump.sql", sql_content)
+            zf.writestr("dump.sql", _DUMP_USERS)
 
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, zip_path)
+        push_database(_DB_CONFIG, zip_path)
 
-        calls = mock_db_conn.execute_sql.call_args_list
-        assert call("DROP TABLE IF EXISTS `users`") in calls
-        assert call("CREATE TABLE `users` (id INT)") in calls
+        calls = db_conn.calls
+        assert "DROP TABLE IF EXISTS `users`" in calls
+        assert "CREATE TABLE `users` (id INT)" in calls
 
-    def test_zip_with_no_sql_raises(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
+    def test_zip_with_no_sql_raises(self, tmp_path: Path) -> None:
         zip_path = tmp_path / "empty.zip"
         with zipfile.ZipFile(zip_path, "w") as zf:
             zf.writestr("readme.txt", "no sql here")
 
-        with (
-            pytest.raises(PushError, match="No .sql file"),
-            patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn),
-        ):
-            push_database(db_config, zip_path)
+        with pytest.raises(PushError, match="No .sql file"):
+            push_database(_DB_CONFIG, zip_path)
 
-    def test_zip_with_multiple_sql_raises(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
+    def test_zip_with_multiple_sql_raises(self, tmp_path: Path) -> None:
         zip_path = tmp_path / "multi.zip"
         with zipfile.ZipFile(zip_path, "w") as zf:
             zf.writestr("a.sql", "DROP TABLE x;")
             zf.writestr("b.sql", "DROP TABLE y;")
 
-        with (
-            pytest.raises(PushError, match="Multiple .sql files"),
-            patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn),
-        ):
-            push_database(db_config, zip_path)
+        with pytest.raises(PushError, match="Multiple .sql files"):
+            push_database(_DB_CONFIG, zip_path)
 
-    def test_missing_zip_raises_file_not_found(
-        self, db_config: DbConfig, tmp_path: Path
-    ) -> None:
+    def test_missing_zip_raises_file_not_found(self, tmp_path: Path) -> None:
         missing = tmp_path / "nope.zip"
         with pytest.raises(PushError, match="SQL file not found"):
-            push_database(db_config, missing)
+            push_database(_DB_CONFIG, missing)
+
+
+class TestPushGzip:
+    def test_decompresses_and_pushes_gz(self, db_conn: RecordingConn, tmp_path: Path) -> None:
+        gz_path = tmp_path / "dump.sql.gz"
+        with gzip.open(gz_path, "wb") as f:
+            f.write(_DUMP_USERS)
+
+        push_database(_DB_CONFIG, gz_path)
+
+        calls = db_conn.calls
+        assert "DROP TABLE IF EXISTS `users`" in calls
+        assert "CREATE TABLE `users` (id INT)" in calls
 
 
 class TestPushTargetEmptyGuard:
-    def test_refuses_non_empty_target_without_force(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text("DROP TABLE IF EXISTS `users`;\n", encoding="utf-8")
-        mock_db_conn.get_tables.return_value = ["users", "posts"]
+    def test_refuses_non_empty_target_without_force(self, db_conn: RecordingConn) -> None:
+        sql_file = io.BytesIO(_DROP_USERS)
+        db_conn.tables = ["users", "posts"]
 
-        with (
-            pytest.raises(PushError, match="not empty"),
-            patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn),
-        ):
-            push_database(db_config, sql_file)
+        with pytest.raises(PushError, match="not empty"):
+            push_database(_DB_CONFIG, sql_file)
 
         # Must have refused before executing any statements.
-        mock_db_conn.execute_sql.assert_not_called()
+        assert db_conn.calls == []
 
-    def test_overwrites_non_empty_target_with_force(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text("DROP TABLE IF EXISTS `users`;\n", encoding="utf-8")
-        mock_db_conn.get_tables.return_value = ["users", "posts"]
+    def test_overwrites_non_empty_target_with_force(self, db_conn: RecordingConn) -> None:
+        sql_file = io.BytesIO(_DROP_USERS)
+        db_conn.tables = ["users", "posts"]
 
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, sql_file, force=True)
+        push_database(_DB_CONFIG, sql_file, force=True)
 
-        calls = mock_db_conn.execute_sql.call_args_list
-        assert call("DROP TABLE IF EXISTS `users`") in calls
+        calls = db_conn.calls
+        assert "DROP TABLE IF EXISTS `users`" in calls
 
-    def test_empty_target_pushes_without_force(
-        self, db_config: DbConfig, mock_db_conn: MagicMock, tmp_path: Path
-    ) -> None:
-        sql_file = tmp_path / "dump.sql"
-        sql_file.write_text("DROP TABLE IF EXISTS `users`;\n", encoding="utf-8")
-        mock_db_conn.get_tables.return_value = []
+    def test_empty_target_pushes_without_force(self, db_conn: RecordingConn) -> None:
+        sql_file = io.BytesIO(_DROP_USERS)
+        db_conn.tables = []
 
-        with patch("sqlbackup.push.DatabaseConnection", return_value=mock_db_conn):
-            push_database(db_config, sql_file)
+        push_database(_DB_CONFIG, sql_file)
 
-        calls = mock_db_conn.execute_sql.call_args_list
-        assert call("DROP TABLE IF EXISTS `users`") in calls
+        calls = db_conn.calls
+        assert "DROP TABLE IF EXISTS `users`" in calls